@@ -3,8 +3,7 @@ Transforming between various types of celestial coordinates.
 """
 
 import enum
-import functools
-from math import acos, asin, atan2, cos, degrees, radians, sin, tan
+from math import acos, asin, atan2, cos, degrees, radians, sin
 
 from .mathutils import PI2, reduce_rad
 
@@ -13,15 +12,6 @@ __license__ = "MIT"
 __version__ = "0.0.1"
 
 
-def _results_to_deg(func):  # type: ignore
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):  # type: ignore
-        a, b = func(*args, **kwargs)
-        return degrees(a), degrees(b)
-
-    return wrapper
-
-
 class ConversionType(enum.IntEnum):
     """Direction of conversion between the Ecliptic and the Equator."""
 
@@ -42,11 +32,15 @@ def _equecl(x: float, y: float, e: float, k: ConversionType) -> tuple[float, flo
     Returns:
         the pair of result coordinates in radians.
     """
-    sinE = sin(e)
+    # the direction only flips the sign of sin(e)
+    sinE = k * sin(e)
     cosE = cos(e)
     sinX = sin(x)
-    a = atan2(sinX * cosE + k.value * (tan(y) * sinE), cos(x))
-    b = asin(sin(y) * cosE - k.value * (cos(y) * sinE * sinX))
+    sinY = sin(y)
+    cosY = cos(y)
+    # tan(y) is derived from the sine and cosine we need anyway
+    a = atan2(sinX * cosE + sinY / cosY * sinE, cos(x))
+    b = asin(sinY * cosE - cosY * sinE * sinX)
     return (reduce_rad(a), b)
 
 
@@ -76,7 +70,6 @@ def _equhor(x: float, y: float, phi: float) -> tuple[float, float]:
     return (p, q)
 
 
-@_results_to_deg  # type: ignore
 def ecl2equ(lmbda: float, beta: float, eps: float) -> tuple[float, float]:
     """Converts ecliptical to equatorial coordinates.
 
@@ -88,12 +81,12 @@ def ecl2equ(lmbda: float, beta: float, eps: float) -> tuple[float, float]:
     Returns:
         the pair of equatorial coordinates, (alpha, delta), in degrees.
     """
-    return _equecl(
+    a, b = _equecl(
         radians(lmbda), radians(beta), radians(eps), ConversionType.ECL_TO_EQU
     )
+    return degrees(a), degrees(b)
 
 
-@_results_to_deg  # type: ignore
 def equ2ecl(alpha: float, delta: float, eps: float) -> tuple[float, float]:
     """Converts equatorial to ecliptical coordinates.
 
@@ -105,12 +98,12 @@ def equ2ecl(alpha: float, delta: float, eps: float) -> tuple[float, float]:
     Returns:
         the pair of ecliptic coordinates, (lambda, beta), in degrees.
     """
-    return _equecl(
+    a, b = _equecl(
         radians(alpha), radians(delta), radians(eps), ConversionType.EQU_TO_ECL
     )
+    return degrees(a), degrees(b)
 
 
-@_results_to_deg  # type: ignore
 def equ2hor(h: float, delta: float, phi: float) -> tuple[float, float]:
     """Converts equatorial to horizontal coordinates.
 
@@ -124,11 +117,10 @@ def equ2hor(h: float, delta: float, phi: float) -> tuple[float, float]:
         * azimuth, in degrees, measured westward from the South
         * altitude, in degrees, positive above the horizon
     """
-
-    return _equhor(radians(h), radians(delta), radians(phi))
+    a, b = _equhor(radians(h), radians(delta), radians(phi))
+    return degrees(a), degrees(b)
 
 
-@_results_to_deg  # type: ignore
 def hor2equ(az: float, alt: float, phi: float) -> tuple[float, float]:
     """Converts horizontal to equatorial coordinates.
 
@@ -144,4 +136,5 @@ def hor2equ(az: float, alt: float, phi: float) -> tuple[float, float]:
         * hour angle, in degrees
         * declination*, in degrees
     """
-    return _equhor(radians(az), radians(alt), radians(phi))
+    a, b = _equhor(radians(az), radians(alt), radians(phi))
+    return degrees(a), degrees(b)
@@ -1,19 +1,60 @@
 """Kepler equation
 """
 
-from math import atan, cos, fabs, sin, sqrt, tan
+from math import atan, atan2, cbrt, cos, fabs, pi, remainder, sin, sqrt, tan
+
+from .mathutils import PI2
 
 __author__ = "ilbagatto"
 __license__ = "MIT"
 __version__ = "0.0.1"
 
-_DELTA = 1e-7  # precision for Kepler equation
+_LOW_ECC = 0.3  # below this eccentricity the atan2 start is used
+_PI_SQ = pi * pi
+
+
+def _danby_step(s: float, m: float, ea: float) -> float:
+    """Quartic correction to an approximate eccentric anomaly ea
+    (J.M.A. Danby, "Fundamentals of Celestial Mechanics").
+    """
+    se = s * sin(ea)
+    ce = s * cos(ea)
+    f = ea - se - m
+    f1 = 1 - ce
+    d1 = -f / f1
+    d2 = -f / (f1 + 0.5 * d1 * se)
+    return -f / (f1 + 0.5 * d2 * se + d2 * d2 * ce / 6)
 
 
-def eccentric_anomaly(s: float, m: float, _ea: float | None = None) -> float:
+def _markley(s: float, m: float) -> float:
+    """Starting value of the eccentric anomaly by F.L.Markley,
+    "Kepler Equation Solver", Celestial Mechanics 63 (1995).
+
+    Args:
+        s: eccentricity
+        m: mean anomaly in range -pi .. pi
+
+    Returns:
+        approximate eccentric anomaly, good to about 1e-5 radians
+    """
+    alpha = (3 * _PI_SQ + 1.6 * pi * (pi - fabs(m)) / (1 + s)) / (_PI_SQ - 6)
+    d = 3 * (1 - s) + alpha * s
+    q = 2 * alpha * d * (1 - s) - m * m
+    r = 3 * alpha * d * (d - 1 + s) * m + m * m * m
+    w = cbrt(fabs(r) + sqrt(q * q * q + r * r)) ** 2
+    return (2 * r * w / (w * w + w * q + q * q) + m) / d
+
+
+def eccentric_anomaly(s: float, m: float) -> float:
     """Solve Kepler equation.
 
-    The function calls itself recursively.
+    The equation is solved without iterations, in a fixed number of steps.
+    For low eccentricities (the Sun and most of the planets) the starting
+    value is `atan2(sin(m), cos(m) - s)`; otherwise Markley's cubic
+    approximation is used. Either value is then refined by a single
+    quartic correction (J.M.A. Danby). The residual of the equation is
+    at rounding level for eccentricities below about 0.15 and from 0.3
+    up, and grows to about 5e-12 radians just below 0.3.
 
     Args:
         s: s (< 1), the eccentricity
@@ -23,13 +64,12 @@ def eccentric_anomaly(s: float, m: float, _ea: float | None = None) -> float:
         the eccentric anomaly
 
     """
-    if _ea is None:
-        _ea = m
-    dla = _ea - (s * sin(_ea)) - m
-    if fabs(dla) < _DELTA:
-        return _ea
-
-    return eccentric_anomaly(s, m, _ea - dla / (1 - (s * cos(_ea))))
+    mr = remainder(m, PI2)  # -pi .. pi
+    if s < _LOW_ECC:
+        ea = atan2(sin(mr), cos(mr) - s)
+    else:
+        ea = _markley(s, mr)
+    return ea + _danby_step(s, mr, ea) + (m - mr)
 
 
 def true_anomaly(s: float, ea: float) -> float:
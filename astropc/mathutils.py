@@ -2,9 +2,8 @@
 """
 
 from collections import namedtuple
-from functools import partial, reduce
-from math import fabs, fmod, modf, pi
-from operator import mul
+from functools import reduce
+from math import fabs, modf, pi
 
 __author__ = "ilbagatto"
 __license__ = "MIT"
@@ -35,10 +34,10 @@ def polynome(t: float, a: float, *args: float) -> float:
     >>> polynome(10.0, 1.0, 2.0, 3.0)
     321.0
     """
-    coeffs = (a,) + args
-    tmul = partial(mul, t)
-    x = reduce(lambda a, b: tmul(a) + b, reversed(coeffs))
-    return x
+    x = 0.0
+    for c in reversed(args):
+        x = x * t + c
+    return x * t + a
 
 
 def to_range(x: float, r: float) -> float:
@@ -56,8 +55,9 @@ def to_range(x: float, r: float) -> float:
     >>> to_range(-700, 360)
     20.0
     """
-    a = fmod(x, r)
-    return a + r if a < 0 else a
+    # for positive r Python's modulo already has the sign of r;
+    # float(r) keeps the result a float for integer arguments
+    return x % float(r)
 
 
 def reduce_deg(x: float) -> float:
@@ -72,7 +72,7 @@ def reduce_deg(x: float) -> float:
     >>> reduce_deg(-700)
     20.0
     """
-    return to_range(x, 360)
+    return x % 360.0
 
 
 def reduce_rad(x: float) -> float:
@@ -87,7 +87,7 @@ def reduce_rad(x: float) -> float:
     >>> round(reduce_rad(12.89), 4)
     0.3236
     """
-    return to_range(x, PI2)
+    return x % PI2
 
 
 def frac(x: float) -> float:
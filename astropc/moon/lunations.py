@@ -7,9 +7,11 @@ __version__ = "0.0.1"
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from math import cos, radians, sin
+from typing import Callable
 
-from astropc.mathutils import reduce_deg
+from astropc.mathutils import reduce_rad
 from astropc.timeutils import day_of_year, is_leapyear
 
 
@@ -28,53 +30,74 @@ class Quarter(QuarterDataMixin, Enum):
     LAST_QUARTER = "Last Quarter", 0.75
 
 
-def _calculate_delta(
-    quarter: Quarter, t: float, ms: float, mm: float, f: float
-) -> float:
+def _delta_new_full(t: float, ms: float, mm: float, f: float) -> float:
+    """Correction to the mean phase for New and Full Moon."""
+    tmm = mm + mm
+    tf = f + f
+    return (
+        (1.734e-1 - 3.93e-4 * t) * sin(ms)
+        + 2.1e-3 * sin(ms + ms)
+        - 4.068e-1 * sin(mm)
+        + 1.61e-2 * sin(tmm)
+        - 4e-4 * sin(mm + tmm)
+        + 1.04e-2 * sin(tf)
+        - 5.1e-3 * sin(ms + mm)
+        - 7.4e-3 * sin(ms - mm)
+        + 4e-4 * sin(tf + ms)
+        - 4e-4 * sin(tf - ms)
+        - 6e-4 * sin(tf + mm)
+        + 1e-3 * sin(tf - mm)
+        + 5e-4 * sin(ms + tmm)
+    )
+
+
+def _delta_quarter(t: float, ms: float, mm: float, f: float, sign: int) -> float:
+    """Correction to the mean phase for the First (sign = 1)
+    and the Last (sign = -1) Quarter.
+    """
     tms = ms + ms
     tmm = mm + mm
     tf = f + f
-
-    if quarter in (Quarter.NEW_MOON, Quarter.FULL_MOON):
-        delta = (
-            (1.734e-1 - 3.93e-4 * t) * sin(ms)
-            + 2.1e-3 * sin(tms)
-            - 4.068e-1 * sin(mm)
-            + 1.61e-2 * sin(tmm)
-            - 4e-4 * sin(mm + tmm)
-            + 1.04e-2 * sin(tf)
-            - 5.1e-3 * sin(ms + mm)
-            - 7.4e-3 * sin(ms - mm)
-            + 4e-4 * sin(tf + ms)
-            - 4e-4 * sin(tf - ms)
-            - 6e-4 * sin(tf + mm)
-            + 1e-3 * sin(tf - mm)
-            + 5e-4 * sin(ms + tmm)
-        )
-    else:
-        delta = (
-            (0.1721 - 0.0004 * t) * sin(ms)
-            + 0.0021 * sin(tms)
-            - 0.6280 * sin(mm)
-            + 0.0089 * sin(tmm)
-            - 0.0004 * sin(tmm + mm)
-            + 0.0079 * sin(tf)
-            - 0.0119 * sin(ms + mm)
-            - 0.0047 * sin(ms - mm)
-            + 0.0003 * sin(tf + ms)
-            - 0.0004 * sin(tf - ms)
-            - 0.0006 * sin(tf + mm)
-            + 0.0021 * sin(tf - mm)
-            + 0.0003 * sin(ms + tmm)
-            + 0.0004 * sin(ms - tmm)
-            - 0.0003 * sin(tms + mm)
-        )
-        w = 0.0028 - 0.0004 * cos(ms) + 0.0003 * cos(ms)
-        if quarter == Quarter.LAST_QUARTER:
-            w = -w
-        delta += w
-
-    return delta
+    w = 0.0028 - 0.0004 * cos(ms) + 0.0003 * cos(mm)
+    return (
+        (0.1721 - 0.0004 * t) * sin(ms)
+        + 0.0021 * sin(tms)
+        - 0.6280 * sin(mm)
+        + 0.0089 * sin(tmm)
+        - 0.0004 * sin(tmm + mm)
+        + 0.0079 * sin(tf)
+        - 0.0119 * sin(ms + mm)
+        - 0.0047 * sin(ms - mm)
+        + 0.0003 * sin(tf + ms)
+        - 0.0004 * sin(tf - ms)
+        - 0.0006 * sin(tf + mm)
+        + 0.0021 * sin(tf - mm)
+        + 0.0003 * sin(ms + tmm)
+        + 0.0004 * sin(ms - tmm)
+        - 0.0003 * sin(tms + mm)
+        + sign * w
+    )
+
+
+# Quarter members are not hashable, so the table is keyed by name
+_DELTA_FUNCS: dict[str, Callable[[float, float, float, float], float]] = {
+    Quarter.NEW_MOON.name: _delta_new_full,
+    Quarter.FIRST_QUARTER.name: partial(_delta_quarter, sign=1),
+    Quarter.FULL_MOON.name: _delta_new_full,
+    Quarter.LAST_QUARTER.name: partial(_delta_quarter, sign=-1),
+}
+
+
+# Terms of the mean arguments, in radians: the Sun's anomaly,
+# the Moon's anomaly and the Moon's argument of latitude
+_MS_TERMS = tuple(radians(x) for x in (359.2242, 29.105356080, -0.0000333, -0.00000347))
+_MM_TERMS = tuple(radians(x) for x in (306.0253, 385.81691806, 0.0107306, 0.00001236))
+_F_TERMS = tuple(radians(x) for x in (21.2964, 390.67050646, -0.0016528, -0.00000239))
+
+
+def _mean_arg(terms: tuple[float, ...], k: float, t2: float, t3: float) -> float:
+    a, b, c, d = terms
+    return reduce_rad(a + b * k + c * t2 + d * t3)
 
 
 def find_closest_phase(quarter: Quarter, year: int, month: int, day: int) -> float:
@@ -88,7 +111,8 @@ def find_closest_phase(quarter: Quarter, year: int, month: int, day: int) -> flo
 
     """
     n = 366 if is_leapyear(year) else 365
-    y = year + day_of_year(year, month, day) / n
+    # fraction of the year elapsed before the given date
+    y = year + (day_of_year(year, month, day) - 1) / n
     k = (
         round((y - 1900) * 12.3685) + quarter.coeff
     )  # TODO: find a better way to access fields
@@ -96,16 +120,13 @@ def find_closest_phase(quarter: Quarter, year: int, month: int, day: int) -> flo
     t2 = t * t
     t3 = t2 * t
 
-    def assemble(a: float, b: float, c: float, d: float) -> float:
-        return radians(reduce_deg(a + b * k + c * t2 + d * t3))
-
     c = radians(166.56 + (132.87 - 9.173e-3 * t) * t)
     j = (
         0.75933 + 29.53058868 * k + 0.0001178 * t2 - 1.55e-07 * t3 + 3.3e-4 * sin(c)
     )  # mean lunar phase
 
-    ms = assemble(359.2242, 29.105356080, -0.0000333, -0.00000347)
-    mm = assemble(306.0253, 385.81691806, 0.0107306, 0.00001236)
-    f = assemble(21.2964, 390.67050646, -0.0016528, -0.00000239)
+    ms = _mean_arg(_MS_TERMS, k, t2, t3)
+    mm = _mean_arg(_MM_TERMS, k, t2, t3)
+    f = _mean_arg(_F_TERMS, k, t2, t3)
 
-    return j + _calculate_delta(quarter, t, ms, mm, f)
+    return j + _DELTA_FUNCS[quarter.name](t, ms, mm, f)
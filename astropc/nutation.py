@@ -5,6 +5,7 @@ Source: P.Duffett-Smith, "Astronomy with Your PC", 2 edition.
 """
 
 from collections import namedtuple
+from functools import lru_cache
 from math import cos, radians, sin
 
 from astropc.mathutils import frac360
@@ -19,9 +20,13 @@ the obliquity of the ecliptic, deps.
 """
 
 
+@lru_cache(maxsize=256)
 def calc_nutation(t: float) -> Nutation:
     """Calculates effects of nutation.
 
+    Positions of the Sun, the Moon and the planets for the same moment
+    all need nutation, so recent results are cached.
+
     Args:
         t (float): number of Julian days elapsed since 1900, Jan 0.5.
 
@@ -35,6 +40,16 @@ def calc_nutation(t: float) -> Nutation:
     ld = radians(2.704342e2 - 1.133e-3 * t2 + frac360(1.336855231e3 * t))
     md = radians(2.961046e2 + 9.192e-3 * t2 + frac360(1.325552359e3 * t))
     nm = radians(2.591833e2 + 2.078e-3 * t2 - frac360(5.372616667 * t))
+    return _nutation_from_args(t, ls, ms, ld, md, nm)
+
+
+def _nutation_from_args(
+    t: float, ls: float, ms: float, ld: float, md: float, nm: float
+) -> Nutation:
+    """Nutation from the fundamental arguments, radians: mean longitude of
+    the Sun, ls, and its mean anomaly, ms; mean longitude of the Moon, ld,
+    its mean anomaly, md, and longitude of its ascending node, nm.
+    """
     tls = ls + ls
     tld = ld + ld
     tnm = nm + nm
@@ -1,7 +1,7 @@
 """Osculating orbital elements"""
 
-from dataclasses import dataclass
-from math import radians
+from dataclasses import dataclass, field
+from math import cos, radians, sin
 
 from astropc.mathutils import frac360, polynome, reduce_deg
 from astropc.timeutils.julian import DAYS_PER_CENT
@@ -14,8 +14,12 @@ __version__ = "0.0.1"
 class Terms:
     """Orbital terms"""
 
+    __slots__ = ("_data", "_cubic")
+
     def __init__(self, *args: float) -> None:
         self._data = args
+        # all the elements are cubic at most, pad to make it unrolled
+        self._cubic = (args + (0.0, 0.0, 0.0))[:4] if len(args) <= 4 else None
 
     @property
     def terms(self) -> tuple[float, ...]:
@@ -30,12 +34,17 @@ class Terms:
         Returns:
             float: arc-degrees
         """
-        return reduce_deg(polynome(t, *self._data))
+        if self._cubic is None:
+            return reduce_deg(polynome(t, *self._data))
+        a, b, c, d = self._cubic
+        return reduce_deg(a + t * (b + t * (c + t * d)))
 
 
 class MLTerms(Terms):
     """Mean Lonitude, a special case of Terms."""
 
+    __slots__ = ()
+
     def __init__(self, a: float, b: float = 0, c: float = 0, d: float = 0) -> None:
         super().__init__(a, b, c, d)
 
@@ -53,13 +62,12 @@ class MLTerms(Terms):
         Returns:
             float: arc-degrees
         """
-        b = frac360(self._data[1] * t)
-        return reduce_deg(
-            self._data[0] + b + (self._data[3] * t + self._data[2]) * t * t
-        )
+        a, b, c, d = self._data
+        # the two halves are independent of each other
+        return reduce_deg(a + frac360(b * t) + t * t * (c + d * t))
 
 
-@dataclass
+@dataclass(slots=True)
 class OrbitInstance:
     """A record holding an orbit instantiated for a given moment of time.
 
@@ -87,6 +95,16 @@ class OrbitInstance:
     daily_motion: float
     """mean daily motion"""
 
+    sin_inclination: float = field(init=False, repr=False)
+    """sine of the inclination"""
+
+    cos_inclination: float = field(init=False, repr=False)
+    """cosine of the inclination"""
+
+    def __post_init__(self) -> None:
+        self.sin_inclination = sin(self.inclination)
+        self.cos_inclination = cos(self.inclination)
+
 
 class OElements:
     """Osculating elements of an orbit"""
@@ -110,6 +128,7 @@ class OElements:
             self._ml.terms[1] * 9.856263e-3
             + (self._ml.terms[2] + self._ml.terms[3]) / DAYS_PER_CENT
         )
+        self._dm_rad = radians(self._dm)
 
     @property
     def mean_longitude(self) -> MLTerms:
@@ -166,12 +185,14 @@ class OElements:
             OrbitInstance object
         """
         ph = self._ph.assemble(t)
+        # same as assemble_mean_anomaly(), without assembling perihelion twice
+        ma = reduce_deg(self._ml.assemble(t) - ph)
         return OrbitInstance(
             perihelion=radians(ph),
             eccentricity=self.eccentricity.assemble(t),
             mean_node=radians(self.mean_node.assemble(t)),
             inclination=radians(self.inclination.assemble(t)),
             major_semiaxis=self.major_semiaxis,
-            mean_anomaly=radians(self.assemble_mean_anomaly(t)),
-            daily_motion=radians(self.daily_motion),
+            mean_anomaly=radians(ma),
+            daily_motion=self._dm_rad,
         )
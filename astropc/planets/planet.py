@@ -3,7 +3,6 @@
 
 from collections import namedtuple
 from dataclasses import dataclass
-from functools import cache
 from math import asin, atan, atan2, cos, degrees, pi, radians, sin, sqrt
 from typing import TYPE_CHECKING
 
@@ -38,7 +37,7 @@ HelioRecord = namedtuple("HelioRecord", "ll rpd lpd spsi cpsi rho")
 HelioRecord.__doc__ = """Params of calculated planetary heliocentric orbit."""
 
 
-@dataclass
+@dataclass(slots=True)
 class EclipticPosition:
     """Ecliptic posiion of a celestial body."""
 
@@ -98,7 +97,7 @@ class Planet:
         self, ctx: "CelestialSphera", dt: float = 0
     ) -> PertRecord:
         """Calculate perturbations."""
-        return self.pert_calculator.get_data(ctx, dt)
+        return self._pert_calculator.get_data(ctx, dt)
 
     @staticmethod
     def _calculate_heliocentric(
@@ -125,12 +124,16 @@ class Planet:
         lp = nu + oi.perihelion + (pert.dml - pert.dm)  # planet's orbital longitude
         lo = lp - oi.mean_node
         sin_lo = sin(lo)
-        spsi = sin_lo * sin(oi.inclination)
-        psi = sin_lo * sin(oi.inclination)
-        y = sin_lo * cos(oi.inclination)
-        psi = asin(spsi) + pert.dhl  # heliocentric latitude
+        spsi = sin_lo * oi.sin_inclination
+        y = sin_lo * oi.cos_inclination
         lpd = atan2(y, cos(lo)) + oi.mean_node + radians(pert.dl)
-        cpsi = cos(psi)
+        if pert.dhl:
+            psi = asin(spsi) + pert.dhl  # heliocentric latitude
+            spsi = sin(psi)
+            cpsi = cos(psi)
+        else:
+            # the latitude is within -pi/2..pi/2, so its cosine is positive
+            cpsi = sqrt(1 - spsi * spsi)
         ll = lpd - lg
 
         # distance from the Earth
@@ -140,7 +143,7 @@ class Planet:
             ll,
             rp * cpsi,
             lpd,
-            sin(psi),  # not the same as spsi, for now psi is corrected
+            spsi,
             cpsi,
             rho,
         )
@@ -151,14 +154,10 @@ class Planet:
         oi: OrbitInstance,
         lg: float,
         rg: float,
-        dt: float = 0,
-        rho: float = 0,
     ) -> HelioRecord:
         """Calculate heliocentric position taking account of the finit light-travel
         time between the Earth and the planet.
 
-        This method is recursive.
-
             When we view a planet now, we see it in the position it occupied t
             hours ago, given by *t = 0.1386 x RH*, where RH is the distance in AU
             between the Earth and the planet. In this routine, an approximate position
@@ -167,26 +166,19 @@ class Planet:
             time based on the approximate position found on the first pass.
 
             -- Peter Duffett-Smith, p.137-138
-        """
 
+        The distance returned is the one found on the first pass.
+        """
+        # first pass: the Earth-planet distance, neglecting the light-time
+        ma = ctx.get_mean_anomaly(self.id, 0.0)
+        pert = self._calculate_perturbations(ctx, 0.0)
+        rho = self._calculate_heliocentric(oi, ma, rg, lg, pert).rho
+        dt = rho * 5.775518e-3
+        # second pass: the planet as it was dt days ago
         ma = ctx.get_mean_anomaly(self.id, dt)
         pert = self._calculate_perturbations(ctx, dt)
-        h = self._calculate_heliocentric(oi, ma, rg, lg, pert)
-        if dt == 0:
-            # take account of the finit light-travel time between the Earth and the planet.
-            # h.rho is the Earth-planet distance
-            return self._get_corrected_helio(
-                ctx, oi, lg, rg, h.rho * 5.775518e-3, h.rho
-            )
-
-        return HelioRecord(
-            h.ll,
-            h.rpd,
-            h.lpd,
-            h.spsi,  # not the same as spsi, for now psi is corrected
-            h.cpsi,
-            rho,
-        )
+        ll, rpd, lpd, spsi, cpsi, _ = self._calculate_heliocentric(oi, ma, rg, lg, pert)
+        return HelioRecord(ll, rpd, lpd, spsi, cpsi, rho)
 
     def geocentric_position(self, ctx: "CelestialSphera") -> "EclipticPosition":
         """Calculate geocentric position of a planet.
@@ -201,22 +193,21 @@ class Planet:
         # convert logitude of the Sun to Earth's position
         lg = radians(sg.phi) + pi
         rsn = sg.rho  # Sun-Earth distance
-        oi = self.orbit.instantiate(ctx.t)
+        oi = ctx.get_orbit_instance(self.id)
         # heliocentric position corrected for light-time travel
-        h = self._get_corrected_helio(ctx, oi, lg, rsn)
+        ll, rpd, lpd, spsi, cpsi, rho = self._get_corrected_helio(ctx, oi, lg, rsn)
 
         # Convert to geocentric
-        sll = sin(h.ll)
-        cll = cos(h.ll)
+        sll = sin(ll)
+        cll = cos(ll)
         # geocentric ecliptic longitude
         lam = (
-            atan2(-1 * h.rpd * sll, rsn - h.rpd * cll) + lg + pi
+            atan2(-1 * rpd * sll, rsn - rpd * cll) + lg + pi
             if self.is_inner
-            else atan2(rsn * sll, h.rpd - rsn * cll) + h.lpd
+            else atan2(rsn * sll, rpd - rsn * cll) + lpd
         )
-        lam = reduce_rad(lam)
         # geocentric latitude
-        bet = atan(h.rpd * h.spsi * sin(lam - h.lpd) / (h.cpsi * rsn * sll))
+        bet = atan(rpd * spsi * sin(lam - lpd) / (cpsi * rsn * sll))
 
         if ctx.apparent:
             # nutation
@@ -224,17 +215,18 @@ class Planet:
             # aberration
             a = lg - lam
             lam -= 9.9387e-5 * cos(a) / cos(bet)
-            lam = reduce_rad(lam)
             bet -= 9.9387e-5 * sin(a) * sin(bet)
 
-        return EclipticPosition(lmbda=degrees(lam), beta=degrees(bet), delta=h.rho)
+        # the longitude is reduced once, the angles above are periodic
+        return EclipticPosition(
+            lmbda=degrees(reduce_rad(lam)), beta=degrees(bet), delta=rho
+        )
 
     @staticmethod
-    @cache
     def for_id(id: PlanetId) -> "Planet":
-        """Factory method for creating a planet instance.
+        """Factory method for getting a planet instance.
 
-        Once created, the object is cached.
+        All the instances are created once, when the module is imported.
 
         Args:
             id (PlanetId): identifier
@@ -242,6 +234,10 @@ class Planet:
         Returns:
             Planet instance.
         """
+        return _PLANETS[id]
+
+    @staticmethod
+    def _create(id: PlanetId) -> "Planet":
         match (id):
             case PlanetId.MERCURY:
                 return Planet(
@@ -369,3 +365,6 @@ class Planet:
                     ),
                     PertPluto(),
                 )
+
+
+_PLANETS = {id: Planet._create(id) for id in PlanetId}
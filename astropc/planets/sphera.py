@@ -5,8 +5,8 @@ For instance, to calculate Mercury perturbations we need
 to know mean anomalies of Venus and Jupiter.
 """
 
-from functools import cache
-from math import radians
+from collections import namedtuple
+from math import cos, radians, sin
 
 from astropc import sun
 from astropc.mathutils import Polar, reduce_rad
@@ -22,6 +22,15 @@ __author__ = "ilbagatto"
 __license__ = "MIT"
 __version__ = "0.0.1"
 
+AuxTrig = namedtuple(
+    "AuxTrig",
+    "sx3 cx3 s2x3 c2x3 s3x3 c3x3 s4x3 c4x3 sx5 cx5 s2x5 c2x5 sx6 "
+    "sx7 cx7 s2x7 c2x7 s3x7 c3x7 s4x7 c4x7 s5x7 c5x7",
+)
+AuxTrig.__doc__ = """Sines and cosines of multiples of the auxiliary Sun-related
+angles x3, x5, x6 and x7 = x3 - x2, shared by Jupiter and Saturn perturbations.
+"""
+
 
 class CelestialSphera:
     """Provides contextual information that is outside of a planet's
@@ -58,14 +67,20 @@ class CelestialSphera:
         self._apparent = apparent
 
         # Auxiliraly Sun-related elements needed for calculating perturbations
-        aux = [0.0] * 6
-        aux[0] = t / 5 + 0.1
-        aux[1] = reduce_rad(4.14473 + 5.29691e1 * t)
-        aux[2] = reduce_rad(4.641118 + 2.132991e1 * t)
-        aux[3] = reduce_rad(4.250177 + 7.478172 * t)
-        aux[4] = 5 * aux[2] - 2 * aux[1]
-        aux[5] = 2 * aux[1] - 6 * aux[2] + 3 * aux[3]
-        self._aux_sun = tuple(aux)
+        # x1 .. x6 are numbered from one, as in _calc_aux_trig()
+        x2 = reduce_rad(4.14473 + 5.29691e1 * t)
+        x3 = reduce_rad(4.641118 + 2.132991e1 * t)
+        x4 = reduce_rad(4.250177 + 7.478172 * t)
+        self._aux_sun = (
+            t / 5 + 0.1,
+            x2,
+            x3,
+            x4,
+            5 * x3 - 2 * x2,
+            2 * x2 - 6 * x3 + 3 * x4,
+        )
+        self._orbits: dict[PlanetId, OrbitInstance] = {}
+        self._aux_trig: AuxTrig | None = None
 
     @property
     def t(self) -> float:
@@ -104,11 +119,11 @@ class CelestialSphera:
         pla = Planet.for_id(id)
         return pla.orbit.instantiate(self.t)
 
-    @cache
     def get_orbit_instance(self, id: PlanetId) -> OrbitInstance:
         """Instantiated orbit.
 
-        Once calculated, the result for given **t** is cached.
+        Once calculated, the result for given **t** is cached in this object,
+        so it is released together with it.
 
         Args:
             id (PlanetId): planet identifier.
@@ -116,7 +131,11 @@ class CelestialSphera:
         Returns:
             OrbitInstance
         """
-        return self._instantiate_orbit(id)
+        try:
+            return self._orbits[id]
+        except KeyError:
+            orbit = self._orbits[id] = self._instantiate_orbit(id)
+            return orbit
 
     def get_mean_anomaly(self, id: PlanetId, dt: float | None = None) -> float:
         """Mean anomaly of a planet.
@@ -129,10 +148,11 @@ class CelestialSphera:
         Returns:
             float: mean anomaly in radians.
         """
-        ma = self.get_orbit_instance(id).mean_anomaly
-        if dt is not None:
-            ma -= radians(dt * Planet.for_id(id).orbit.daily_motion)
-        return ma
+        oi = self.get_orbit_instance(id)
+        if dt is None:
+            return oi.mean_anomaly
+        # the instance keeps the daily motion in radians
+        return oi.mean_anomaly - dt * oi.daily_motion
 
     @staticmethod
     def create(djd: float, apparent: bool = True) -> "CelestialSphera":
@@ -163,3 +183,56 @@ class CelestialSphera:
     @property
     def aux_sun(self) -> tuple[float, ...]:
         return self._aux_sun
+
+    @property
+    def aux_trig(self) -> AuxTrig:
+        """Trigonometric functions of the auxiliary elements.
+
+        They do not depend on the light-time correction, so they are calculated
+        once, on the first access.
+        """
+        if self._aux_trig is None:
+            self._aux_trig = self._calc_aux_trig()
+        return self._aux_trig
+
+    def _calc_aux_trig(self) -> AuxTrig:
+        _, x2, x3, _, x5, x6 = self._aux_sun
+        x7 = x3 - x2
+        # multiple angles are found by the angle-addition formulas
+        sx3 = sin(x3)
+        cx3 = cos(x3)
+        s2x3 = 2 * sx3 * cx3
+        c2x3 = cx3 * cx3 - sx3 * sx3
+        sx5 = sin(x5)
+        cx5 = cos(x5)
+        sx7 = sin(x7)
+        cx7 = cos(x7)
+        s2x7 = 2 * sx7 * cx7
+        c2x7 = cx7 * cx7 - sx7 * sx7
+        s4x7 = 2 * s2x7 * c2x7
+        c4x7 = c2x7 * c2x7 - s2x7 * s2x7
+        return AuxTrig(
+            sx3=sx3,
+            cx3=cx3,
+            s2x3=s2x3,
+            c2x3=c2x3,
+            s3x3=s2x3 * cx3 + c2x3 * sx3,
+            c3x3=c2x3 * cx3 - s2x3 * sx3,
+            s4x3=2 * s2x3 * c2x3,
+            c4x3=c2x3 * c2x3 - s2x3 * s2x3,
+            sx5=sx5,
+            cx5=cx5,
+            s2x5=2 * sx5 * cx5,
+            c2x5=cx5 * cx5 - sx5 * sx5,
+            sx6=sin(x6),
+            sx7=sx7,
+            cx7=cx7,
+            s2x7=s2x7,
+            c2x7=c2x7,
+            s3x7=s2x7 * cx7 + c2x7 * sx7,
+            c3x7=c2x7 * cx7 - s2x7 * sx7,
+            s4x7=s4x7,
+            c4x7=c4x7,
+            s5x7=s4x7 * cx7 + c4x7 * sx7,
+            c5x7=c4x7 * cx7 - s4x7 * sx7,
+        )
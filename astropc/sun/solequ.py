@@ -1,8 +1,9 @@
 from collections import namedtuple
 from enum import Enum, auto
-from math import radians, sin
+from functools import lru_cache
+from math import fabs
 
-from astropc.mathutils import shortest_arc_deg
+from astropc.mathutils import diff_angle
 
 from .sun import apparent
 
@@ -21,6 +22,7 @@ class SolEquType(Enum):
 
 
 _DELTA = 1e-6
+_DAYS_PER_DEGREE = 365.2422 / 360
 
 
 SolEquEvent = namedtuple("SolEquEvent", "djd sun")
@@ -30,9 +32,12 @@ sun is apparent longitude of the Sun, arc-degrees
 """
 
 
+@lru_cache(maxsize=256)
 def sol_equ(year: int, event_type: SolEquType) -> SolEquEvent:
     """Calculate circumstances of Solstice/Equinox event.
 
+    The results are cached, so asking for the same event again is cheap.
+
     Args:
         year (int): year
         event_type (SolEquType): event type
@@ -51,10 +56,17 @@ def sol_equ(year: int, event_type: SolEquType) -> SolEquEvent:
             k = 3
     k90 = k * 90
     dj = (year + k / 4.0) * 365.2422 - 693878.7  # shorter but less exact way
+    rate = _DAYS_PER_DEGREE
+    prev_dj = prev_dx = None
     while True:
         sg = apparent(dj, ignore_light_travel=True)
         x = sg.phi
-        dj += 58.0 * sin(radians(k90 - x))
-        if shortest_arc_deg(k90, x) < _DELTA:
+        dx = diff_angle(x, k90)  # arc-degrees left to go
+        if prev_dx is not None and dx != prev_dx:
+            # secant step: the Sun's actual rate near the event
+            rate = (prev_dj - dj) / (dx - prev_dx)
+        prev_dj, prev_dx = dj, dx
+        dj += rate * dx
+        if fabs(dx) < _DELTA:
             break
     return SolEquEvent(dj, x)
@@ -1,12 +1,11 @@
 """Position of the Sun.
 """
 
-from functools import partial
 from math import cos, degrees, floor, radians, sin
 
 from astropc import nutation
 from astropc.kepler import eccentric_anomaly, true_anomaly
-from astropc.mathutils import PI2, Polar, frac360, polynome, reduce_deg
+from astropc.mathutils import PI2, Polar, frac360, reduce_deg
 from astropc.timeutils.julian import DAYS_PER_CENT
 
 __author__ = "ilbagatto"
@@ -44,10 +43,6 @@ def mean_anomaly(t: float) -> float:
     )
 
 
-def _calc_perturbations(t: float, a: float, b: float) -> float:
-    return radians(a + frac360(b * t))
-
-
 def true_geocentric(t: float, ms: float | None = None) -> Polar:
     """Calculates true geocentric position of the Sun for the mean equinox of date.
 
@@ -65,18 +60,16 @@ def true_geocentric(t: float, ms: float | None = None) -> Polar:
 
     ls = mean_longitude(t)
     ma = radians(ms)
-    s = polynome(t, 1.675104e-2, -4.18e-5, -1.26e-7)  # eccentricity
+    s = 1.675104e-2 - t * (4.18e-5 + 1.26e-7 * t)  # eccentricity
     ea = eccentric_anomaly(s, ma - PI2 * floor(ma / PI2))  # eccentric anomaly
     nu = true_anomaly(s, ea)  # true anomaly
     t2 = t * t
 
-    calc_pert = partial(_calc_perturbations, t)
-
-    a = calc_pert(153.23, 6.255209472e1)  # Venus
-    b = calc_pert(216.57, 1.251041894e2)  # ?
-    c = calc_pert(312.69, 9.156766028e1)  # ?
-    d = calc_pert(350.74 - 1.44e-3 * t2, 1.236853095e3)  # Moon
-    h = calc_pert(353.4, 1.831353208e2)  # ?
+    a = radians(153.23 + frac360(6.255209472e1 * t))  # Venus
+    b = radians(216.57 + frac360(1.251041894e2 * t))  # ?
+    c = radians(312.69 + frac360(9.156766028e1 * t))  # ?
+    d = radians(350.74 - 1.44e-3 * t2 + frac360(1.236853095e3 * t))  # Moon
+    h = radians(353.4 + frac360(1.831353208e2 * t))  # ?
     e = radians(231.19 + 20.2 * t)  # inequality of long period
 
     # correction in orbital longitude
@@ -22,8 +22,6 @@ from collections import namedtuple
 from datetime import datetime, timezone
 from math import fabs, floor, modf, trunc
 
-from astropc.mathutils import dms
-
 __author__ = "ilbagatto"
 __license__ = "MIT"
 __version__ = "0.0.1"
@@ -44,6 +42,10 @@ DJD_TO_JD = 2415020
 DAYS_PER_CENT = 36525
 """Days per century (36525)."""
 
+# days elapsed before the first day of each month
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_BEFORE_MONTH_LEAP = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
 
 class CalendarException(Exception):
     """Base class for calendar related exceptions."""
@@ -118,9 +120,10 @@ def jul_day(
         y -= 1
 
     if after_gregorian(year, month, day, gregorian_start):
-        # after Gregorian calendar
-        a = trunc(y / 100)
-        b = 2 - a + trunc(a / 4)
+        # after Gregorian calendar; the proleptic correction needs
+        # floor division, which also holds for zero and negative years
+        a = y // 100
+        b = 2 - a + a // 4
     else:
         b = 0
 
@@ -193,9 +196,8 @@ def weekday(djd: float) -> int:
     3 # Wednesday
 
     """
-    d0 = djd_midnight(djd)
-    j0 = d0 + DJD_TO_JD
-    return int((j0 + 1.5) % 7)
+    # floor(djd + 0.5) is the same day as djd_midnight(djd) + 0.5, in integers
+    return (floor(djd + 0.5) + DJD_TO_JD + 1) % 7
 
 
 def is_leapyear(ye: int) -> bool:
@@ -213,7 +215,8 @@ def is_leapyear(ye: int) -> bool:
     >>> leap_year(2001)
     False
     """
-    return (ye % 4 == 0) and ((ye % 100 != 0) or (ye % 400 == 0))
+    # divisible by 400 is the same as divisible by 16 and 25, once divisible by 4
+    return (ye & 3) == 0 and (ye % 25 != 0 or (ye & 15) == 0)
 
 
 def day_of_year(year: int, month: int, day: float) -> int:
@@ -234,11 +237,8 @@ def day_of_year(year: int, month: int, day: float) -> int:
     1
 
     """
-    k = 1 if is_leapyear(year) else 2
-    a = floor(275 * month / 9)
-    b = floor(k * ((month + 9) / 12.0))
-    c = floor(day)
-    return a - b + c - 30
+    days = _DAYS_BEFORE_MONTH_LEAP if is_leapyear(year) else _DAYS_BEFORE_MONTH
+    return days[month - 1] + floor(day)
 
 
 def djd_zero(year: int) -> float:
@@ -275,8 +275,10 @@ def djd_to_datetime(djd: float) -> datetime:
 
     """
     (year, month, day) = cal_date(djd)
-    f, d = modf(day)
-    (ho, mi, se) = dms(f * 24)
-    f, s = modf(se)
-    ms = f * 1000000  # microsecond
-    return datetime(year, month, int(d), ho, mi, int(s), int(ms), tzinfo=timezone.utc)
+    d = int(day)
+    # microseconds since midnight; rounding must not reach the next day
+    us = min(round((day - d) * 86_400_000_000), 86_399_999_999)
+    mi, us = divmod(us, 60_000_000)
+    ho, mi = divmod(mi, 60)
+    se, us = divmod(us, 1_000_000)
+    return datetime(year, month, d, ho, mi, se, us, tzinfo=timezone.utc)
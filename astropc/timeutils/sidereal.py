@@ -25,21 +25,45 @@ Caveats
  -- Peter Duffett-Smith, "Astronomy with your PC"
 """
 
+from functools import lru_cache
+from math import floor
+
 from astropc.mathutils import to_range
 
-from .julian import cal_date, djd_midnight, jul_day
+from .julian import cal_date, djd_midnight, djd_zero, jul_day
 
 __author__ = "ilbagatto"
 __license__ = "MIT"
 __version__ = "0.0.1"
 
 _SID_RATE = 0.9972695677
+_INV_SID_RATE = 1.0 / _SID_RATE
 _AMBIG_DELTA = 6.552e-2
-
-
+_GREG_YEARS_START = djd_zero(1583) + 1  # January 1.0, 1583
+
+
+def _year_start(djd: float) -> tuple[int, float]:
+    """Civil year of a date and DJD of its January 0.0."""
+    if djd < _GREG_YEARS_START:
+        (year, _, _) = cal_date(djd)
+        return year, jul_day(year, 1, 0.0)
+    # Gregorian years, no need for the full calendar date
+    year = 1900 + floor(djd / 365.2425)
+    dj0 = djd_zero(year)
+    if djd < dj0 + 1:
+        year -= 1
+        dj0 = djd_zero(year)
+    else:
+        dj1 = djd_zero(year + 1)
+        if djd >= dj1 + 1:
+            year += 1
+            dj0 = dj1
+    return year, dj0
+
+
+@lru_cache(maxsize=1024)
 def _tnaught(djd: float) -> float:
-    (year, _, _) = cal_date(djd)
-    dj0 = jul_day(year, 1, 0.0)
+    year, dj0 = _year_start(djd)
     t = dj0 / 36525
     x = 6.57098e-2 * (djd - dj0) - (
         24
@@ -62,7 +86,7 @@ def djd_to_sidereal(djd: float, lng: float = 0.0) -> float:
     djm = djd_midnight(djd)
     utc = (djd - djm) * 24
     t0 = _tnaught(djm)
-    gst = (1.0 / _SID_RATE) * utc + t0
+    gst = _INV_SID_RATE * utc + t0
     lst = gst - lng / 15
     return to_range(lst, 24.0)
 
@@ -77,6 +77,11 @@ class TestEquHor:
         _, got_altitude = equ2hor(ha * 15, delta, theta)
         assert approx(got_altitude, abs=DELTA) == altitude
 
+    @mark.parametrize("theta", [30.0, 45.0])
+    def test_zenith(self, theta):
+        # an object on the meridian with declination equal to the latitude
+        assert equ2hor(0.0, theta, theta) == approx((90.0, 90.0), abs=DELTA)
+
 
 class TestHorEqu:
     @mark.parametrize(
@@ -100,3 +105,9 @@ class TestHorEqu:
     def test_delta(self, azimuth, altitude, theta, delta):
         _, got_delta = hor2equ(azimuth, altitude, theta)
         assert approx(got_delta, abs=DELTA) == delta
+
+    @mark.parametrize("theta", [30.0, 45.0])
+    def test_zenith(self, theta):
+        got_ha, got_delta = hor2equ(0.0, 90.0, theta)
+        assert approx(got_ha % 360, abs=DELTA) == 0.0
+        assert approx(got_delta, abs=DELTA) == theta
@@ -3,6 +3,7 @@ from pytest import approx, fixture, mark, raises
 from astropc.mathutils import ddd
 from astropc.timeutils import CalendarException
 from astropc.timeutils.julian import (
+    YearMonthDay,
     cal_date,
     day_of_year,
     djd_midnight,
@@ -49,6 +50,17 @@ class TestJulianDay:
         assert got_month == month
         assert approx(got_day, abs=self.delta) == day
 
+    @mark.parametrize(
+        "year, month, day, djd",
+        [
+            (-501, 6, 1.0, -876430.5),
+            (-101, 6, 1.0, -730333.5),
+        ],
+    )
+    def test_proleptic_gregorian(self, year, month, day, djd):
+        got = jul_day(year, month, day, YearMonthDay(-4713, 1, 1))
+        assert approx(got, abs=self.delta) == djd
+
     def test_zero_day(self):
         got = jul_day(1900, 1, 0.5)
         assert approx(got, abs=self.delta) == 0.0
@@ -155,6 +167,14 @@ def test_first_day_of_year():
     assert day_of_year(2000, 1, 1) == 1
 
 
+def test_first_day_of_non_leap_year():
+    assert day_of_year(1990, 1, 1) == 1
+
+
+def test_non_leap_february():
+    assert day_of_year(1990, 2, 28) == 59
+
+
 class TestDateTime:
 
     @fixture()
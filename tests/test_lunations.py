@@ -9,6 +9,7 @@ from astropc.moon.lunations import Quarter, find_closest_phase
         (1984, 9, 1, 30919.3097),  # 1984, 8, 26, 19, 26
         (1968, 12, 12, 25190.263194),  # 1968, 12, 19, 18, 19
         (2019, 8, 21, 43705.94287),
+        (1990, 1, 10, 32868.63902),  # 1989, 12, 28, 3, 20
     ],
 )
 def test_new_moon(year, month, day, djd):
@@ -31,6 +32,7 @@ def test_first_quarter(year, month, day, djd):
         (1984, 9, 1, 30933.79236),  # 1984, 9, 10, 7, 1
         (1965, 2, 1, 23787.52007),
         (2019, 8, 21, 43720.69049),
+        (1990, 12, 1, 33207.82722),  # 1990, 12, 2, 7, 51
     ],
 )
 def test_full_moon(year, month, day, djd):
@@ -43,3 +45,15 @@ def test_full_moon(year, month, day, djd):
 )
 def test_last_quarter(year, month, day, djd):
     assert approx(djd) == find_closest_phase(Quarter.LAST_QUARTER, year, month, day)
+
+
+@mark.parametrize(
+    "quarter, year, month, day, djd",
+    [
+        (Quarter.FIRST_QUARTER, 2020, 6, 15, 44008.84480),  # 2020, 6, 28, 8, 16
+        (Quarter.LAST_QUARTER, 2024, 6, 15, 45470.41326),  # 2024, 6, 28, 21, 55
+    ],
+)
+def test_quarter_correction(quarter, year, month, day, djd):
+    # the W term shifts quarters by up to 0.0006 days, below approx's default
+    assert approx(djd, abs=1e-5) == find_closest_phase(quarter, year, month, day)
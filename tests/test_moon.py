@@ -1,4 +1,4 @@
-from pytest import approx
+from pytest import approx, fixture, mark
 
 from astropc.moon import apparent, lunar_node, true_position
 
@@ -128,25 +128,30 @@ class TestTruePosition:
         },
     )
 
-    def test_lambda(self):
-        for case in self.cases:
-            pos = true_position(case["djd"])
-            assert approx(pos.lmbda, abs=self.delta) == case["coords"][0]
+    @fixture(scope="class")
+    @classmethod
+    def positions(cls):
+        return {case["djd"]: true_position(case["djd"]) for case in cls.cases}
 
-    def test_beta(self):
-        for case in self.cases:
-            pos = true_position(case["djd"])
-            assert approx(pos.beta, abs=self.delta) == case["coords"][1]
+    @mark.parametrize("case", cases)
+    def test_lambda(self, positions, case):
+        pos = positions[case["djd"]]
+        assert approx(pos.lmbda, abs=self.delta) == case["coords"][0]
 
-    def test_parallax(self):
-        for case in self.cases:
-            pos = true_position(case["djd"])
-            assert approx(pos.parallax, abs=self.delta) == case["coords"][2]
+    @mark.parametrize("case", cases)
+    def test_beta(self, positions, case):
+        pos = positions[case["djd"]]
+        assert approx(pos.beta, abs=self.delta) == case["coords"][1]
 
-    def test_delta(self):
-        for case in self.cases:
-            pos = true_position(case["djd"])
-            assert approx(pos.delta, abs=self.delta) == case["delta"]
+    @mark.parametrize("case", cases)
+    def test_parallax(self, positions, case):
+        pos = positions[case["djd"]]
+        assert approx(pos.parallax, abs=self.delta) == case["coords"][2]
+
+    @mark.parametrize("case", cases)
+    def test_delta(self, positions, case):
+        pos = positions[case["djd"]]
+        assert approx(pos.delta, abs=self.delta) == case["delta"]
 
 
 class TestApparent:
@@ -157,10 +162,10 @@ class TestApparent:
         {"djd": 16773.8121, "lng": 246.94925},  # 1945-12-4.3121,
     )
 
-    def test_longitude(self):
-        for c in self.cases:
-            pos = apparent(c["djd"])
-            assert approx(pos.lmbda, abs=self.delta) == c["lng"]
+    @mark.parametrize("c", cases)
+    def test_longitude(self, c):
+        pos = apparent(c["djd"])
+        assert approx(pos.lmbda, abs=self.delta) == c["lng"]
 
 
 class TestLunarNode:
@@ -1,4 +1,4 @@
-from pytest import approx
+from pytest import approx, mark
 
 from astropc.nutation import calc_nutation
 from astropc.timeutils.julian import jul_day
@@ -45,15 +45,15 @@ cases = (
 )
 
 
-def test_dpsi():
-    for c in cases:
-        t = c["djd"] / 36525
-        nut = calc_nutation(t)
-        assert approx(nut.dpsi, abs=delta) == c["dpsi"]
+@mark.parametrize("c", cases)
+def test_dpsi(c):
+    t = c["djd"] / 36525
+    nut = calc_nutation(t)
+    assert approx(nut.dpsi, abs=delta) == c["dpsi"]
 
 
-def test_deps():
-    for c in cases:
-        t = c["djd"] / 36525
-        nut = calc_nutation(t)
-        assert approx(nut.deps, abs=delta) == c["deps"]
+@mark.parametrize("c", cases)
+def test_deps(c):
+    t = c["djd"] / 36525
+    nut = calc_nutation(t)
+    assert approx(nut.deps, abs=delta) == c["deps"]
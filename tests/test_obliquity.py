@@ -1,20 +1,21 @@
-from pytest import approx
+from pytest import approx, mark
 
 from astropc.obliq import calc_obliquity
 
 DELTA = 1e-4  # result precision
 
 
-def test_mean_obliquity():
-    # P.Duffett-Smith, "Astronomy With Your Personal Computer", p.54
-    cases = (
+@mark.parametrize(
+    "c",
+    [
+        # P.Duffett-Smith, "Astronomy With Your Personal Computer", p.54
         {"djd": 29120.5, "eps": 23.441917},  # 1979-09-24.0
         {"djd": 36524.5, "eps": 23.439278},  # 2000-01-01.0
-    )
-
-    for c in cases:
-        got = calc_obliquity(c["djd"])
-        assert approx(got, abs=DELTA) == c["eps"]
+    ],
+)
+def test_mean_obliquity(c):
+    got = calc_obliquity(c["djd"])
+    assert approx(got, abs=DELTA) == c["eps"]
 
 
 def test_true_obliquity():
@@ -49,5 +49,9 @@ class TestOElements:
     def test_inclination(self, orbit):
         assert approx(orbit.inclination, abs=DELTA) == 0.12225040301524157
 
+    def test_inclination_trig(self, orbit):
+        assert approx(orbit.sin_inclination, abs=DELTA) == 0.12194612182084548
+        assert approx(orbit.cos_inclination, abs=DELTA) == 0.9925367214228679
+
     def test_semiaxis(self, orbit):
         assert approx(orbit.major_semiaxis, abs=DELTA) == 0.3870986
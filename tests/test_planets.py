@@ -55,8 +55,9 @@ class TestHeliocentric:
 class TestGeocentric:
     delta = 1e-4
 
-    @fixture()
-    def sphera(self):
+    @fixture(scope="class")
+    @classmethod
+    def sphera(cls):
         return CelestialSphera.create(30700.5, apparent=False)
 
     def _compare(self, id, exp, sphera):
@@ -17,21 +17,21 @@ cases = (
 )
 
 
-def test_utc_to_gst():
-    for c in cases:
-        got = djd_to_sidereal(c["djd"])
-        assert pytest.approx(got, abs=DELTA) == c["lst"]
+@pytest.mark.parametrize("c", cases)
+def test_utc_to_gst(c):
+    got = djd_to_sidereal(c["djd"])
+    assert pytest.approx(got, abs=DELTA) == c["lst"]
 
 
-def test_gst_to_utc_non_ambiguous():
-    for c in [c for c in cases if c["ok"]]:
-        (utc, not_ok) = sidereal_to_utc(c["lst"], c["djd"])
-        assert pytest.approx(utc, abs=DELTA) == c["utc"]
-        assert not not_ok
+@pytest.mark.parametrize("c", [c for c in cases if c["ok"]])
+def test_gst_to_utc_non_ambiguous(c):
+    (utc, not_ok) = sidereal_to_utc(c["lst"], c["djd"])
+    assert pytest.approx(utc, abs=DELTA) == c["utc"]
+    assert not not_ok
 
 
-def test_gst_to_utc_ambiguous():
-    for c in [c for c in cases if not c["ok"]]:
-        (utc, not_ok) = sidereal_to_utc(c["lst"], c["djd"])
-        # assert pytest.approx(utc, abs=DELTA) == c["utc"]
-        assert not_ok
+@pytest.mark.parametrize("c", [c for c in cases if not c["ok"]])
+def test_gst_to_utc_ambiguous(c):
+    (utc, not_ok) = sidereal_to_utc(c["lst"], c["djd"])
+    # assert pytest.approx(utc, abs=DELTA) == c["utc"]
+    assert not_ok
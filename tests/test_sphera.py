@@ -8,7 +8,7 @@ from astropc.planets.sphera import CelestialSphera
 DELTA = 1e-6
 
 
-@fixture()
+@fixture(scope="module")
 def sphera():
     return CelestialSphera.create(30700.5)
 
@@ -19,7 +19,7 @@ class TestSpheraProps:
         assert approx(sphera.t, abs=DELTA) == 0.8405338809034908
 
     def test_sungeo_phi(self, sphera):
-        assert approx(sphera.sun_geo.phi, abs=DELTA) == 300.1307723107521
+        assert approx(sphera.sun_geo.phi, abs=DELTA) == 300.13076878827763
 
     def test_sungeo_rho(self, sphera):
         assert approx(sphera.sun_geo.rho, abs=DELTA) == 0.9839698373786032
@@ -72,6 +72,11 @@ class TestMeanAnomalies:
 
 
 class TestCache:
+    @fixture()
+    def sphera(self):
+        # spied on, and the orbits cache must be empty
+        return CelestialSphera.create(30700.5)
+
     def test_get_same_orbit_instance(self, sphera, mocker):
         spy = mocker.spy(sphera, "_instantiate_orbit")
         sphera.get_orbit_instance(PlanetId.MERCURY)
@@ -1,4 +1,4 @@
-from pytest import approx
+from pytest import approx, mark
 
 from astropc.sun.solequ import SolEquType, sol_equ
 from astropc.sun.sun import apparent, true_geocentric
@@ -35,17 +35,17 @@ class TestSunPosition:
         },
     )
 
-    def test_geometric(self):
-        for c in self.cases:
-            t = c["djd"] / 36525
-            geo = true_geocentric(t)
-            assert approx(geo.phi, delta) == c["l"]
-            assert approx(geo.rho, delta) == c["r"]
+    @mark.parametrize("c", cases)
+    def test_geometric(self, c):
+        t = c["djd"] / 36525
+        geo = true_geocentric(t)
+        assert approx(geo.phi, delta) == c["l"]
+        assert approx(geo.rho, delta) == c["r"]
 
-    def test_apparent(self):
-        for c in self.cases:
-            geo = apparent(c["djd"], ignore_light_travel=True)
-            assert approx(geo.phi, delta) == c["ap"]
+    @mark.parametrize("c", cases)
+    def test_apparent(self, c):
+        geo = apparent(c["djd"], ignore_light_travel=True)
+        assert approx(geo.phi, delta) == c["ap"]
 
 
 class TestSolEqu:
@@ -89,12 +89,12 @@ class TestSolEqu:
         },
     )
 
-    def test_djd(self):
-        for c in self.cases:
-            evt = sol_equ(c["year"], c["event"])
-            assert approx(evt.djd, abs=1e-2) == c["djd"]
+    @mark.parametrize("c", cases)
+    def test_djd(self, c):
+        evt = sol_equ(c["year"], c["event"])
+        assert approx(evt.djd, abs=1e-2) == c["djd"]
 
-    def test_sun(self):
-        for c in self.cases:
-            evt = sol_equ(c["year"], c["event"])
-            assert approx(evt.sun, abs=delta) == c["angle"]
+    @mark.parametrize("c", cases)
+    def test_sun(self, c):
+        evt = sol_equ(c["year"], c["event"])
+        assert approx(evt.sun, abs=delta) == c["angle"]